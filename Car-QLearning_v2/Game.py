@@ -9,6 +9,53 @@ import pygame
 drawer = Drawer()
 vec2 = pygame.math.Vector2
 
+# corner sign pattern shared by every hitCar call; hitCar used to
+# rebuild this list of lists per wall per frame
+CORNER_MULTIPLIERS = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+
+# numba compiles the ray-wall intersection loop to machine code; without
+# it the plain Python function below still works, just slower
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return wrap
+
+
+@njit(cache=True)
+def _closestWallHit(x1, y1, x2, y2, walls):
+    """Closest intersection of segment (x1,y1)-(x2,y2) with the wall array.
+
+    walls is an (N, 4) float array of segment endpoints. Returns (0, 0)
+    when nothing is hit, matching the old sentinel value.
+    """
+    minDist = 1.0e30
+    hitX = 0.0
+    hitY = 0.0
+    for i in range(walls.shape[0]):
+        x3 = walls[i, 0]
+        y3 = walls[i, 1]
+        x4 = walls[i, 2]
+        y4 = walls[i, 3]
+        denom = (y4 - y3) * (x2 - x1) - (x4 - x3) * (y2 - y1)
+        if denom == 0.0:
+            continue
+        uA = ((x4 - x3) * (y1 - y3) - (y4 - y3) * (x1 - x3)) / denom
+        uB = ((x2 - x1) * (y1 - y3) - (y2 - y1) * (x1 - x3)) / denom
+        if 0.0 <= uA <= 1.0 and 0.0 <= uB <= 1.0:
+            ix = x1 + uA * (x2 - x1)
+            iy = y1 + uA * (y2 - y1)
+            d = (ix - x1) ** 2 + (iy - y1) ** 2
+            if d < minDist:
+                minDist = d
+                hitX = ix
+                hitY = iy
+    return hitX, hitY
+
 
 class Game:
     no_of_actions = 9
@@ -136,7 +183,10 @@ class Game:
 
 
     def get_state(self):
-        return self.car.getState()
+        # hand out a copy: the PER memory in QlearningFromOldMate stores
+        # states by reference across steps, while car.getState() reuses
+        # one internal buffer
+        return np.array(self.car.getState())
         pass
 
     def make_action(self, action):
@@ -173,6 +223,9 @@ class Game:
 
 
 class Wall:
+    # tracks hold dozens of walls and hitCar reads the endpoints every
+    # frame; slots drop the per-instance dict and fix the attribute offsets
+    __slots__ = ('x1', 'y1', 'x2', 'y2', 'line')
 
     def __init__(self, x1, y1, x2, y2):
         self.x1 = x1
@@ -202,11 +255,10 @@ class Wall:
         rightVector = vec2(car.direction)
         upVector = vec2(car.direction).rotate(-90)
         carCorners = []
-        cornerMultipliers = [[1, 1], [1, -1], [-1, -1], [-1, 1]]
         carPos = vec2(car.x, car.y)
         for i in range(4):
-            carCorners.append(carPos + (rightVector * cw / 2 * cornerMultipliers[i][0]) +
-                              (upVector * ch / 2 * cornerMultipliers[i][1]))
+            carCorners.append(carPos + (rightVector * cw / 2 * CORNER_MULTIPLIERS[i][0]) +
+                              (upVector * ch / 2 * CORNER_MULTIPLIERS[i][1]))
 
         for i in range(4):
             j = i + 1
@@ -219,6 +271,7 @@ class Wall:
 
 
 class RewardGate:
+    __slots__ = ('x1', 'y1', 'x2', 'y2', 'active', 'line', 'center')
 
     def __init__(self, x1, y1, x2, y2):
         global vec2
@@ -257,11 +310,10 @@ class RewardGate:
         rightVector = vec2(car.direction)
         upVector = vec2(car.direction).rotate(-90)
         carCorners = []
-        cornerMultipliers = [[1, 1], [1, -1], [-1, -1], [-1, 1]]
         carPos = vec2(car.x, car.y)
         for i in range(4):
-            carCorners.append(carPos + (rightVector * cw / 2 * cornerMultipliers[i][0]) +
-                              (upVector * ch / 2 * cornerMultipliers[i][1]))
+            carCorners.append(carPos + (rightVector * cw / 2 * CORNER_MULTIPLIERS[i][0]) +
+                              (upVector * ch / 2 * CORNER_MULTIPLIERS[i][1]))
 
         for i in range(4):
             j = i + 1
@@ -309,11 +361,18 @@ class Car:
         self.accelerating = False
         self.reversing = False
         self.walls = walls
+        # contiguous copy of the wall endpoints for the jitted ray caster
+        self.walls_arr = np.array([[w.x1, w.y1, w.x2, w.y2] for w in walls],
+                                  dtype=np.float64)
         self.rewardGates = rewardGates
         self.rewardNo = 0
 
         self.directionToRewardGate = self.rewardGates[self.rewardNo].center - vec2(self.x, self.y)
 
+        # observation buffer reused by every getState() call so the
+        # training loop never allocates per step
+        self._state_buf = np.empty(Game.state_size, dtype=np.float32)
+
         self.reward = 0
 
         self.score = 0
@@ -355,7 +414,9 @@ class Car:
         drawX = self.direction.x * self.width / 2 + upVector.x * self.height / 2
         drawY = self.direction.y * self.width / 2 + upVector.y * self.height / 2
         self.carSprite.update(x=self.x - drawX, y=self.y - drawY, rotation=-get_angle(self.direction))
-        self.carSprite.draw()
+        # when the sprite belongs to a batch the window draws it for us
+        if self.carSprite.batch is None:
+            self.carSprite.draw()
         # self.showCollisionVectors()
 
     """
@@ -546,16 +607,9 @@ class Car:
 
     def getCollisionPointOfClosestWall(self, x1, y1, x2, y2):
         global vec2
-        minDist = 2 * displayWidth
-        closestCollisionPoint = vec2(0, 0)
-        for wall in self.walls:
-            collisionPoint = getCollisionPoint(x1, y1, x2, y2, wall.x1, wall.y1, wall.x2, wall.y2)
-            if collisionPoint is None:
-                continue
-            if dist(x1, y1, collisionPoint.x, collisionPoint.y) < minDist:
-                minDist = dist(x1, y1, collisionPoint.x, collisionPoint.y)
-                closestCollisionPoint = vec2(collisionPoint)
-        return closestCollisionPoint
+        hitX, hitY = _closestWallHit(float(x1), float(y1), float(x2), float(y2),
+                                     self.walls_arr)
+        return vec2(hitX, hitY)
 
     """
     by creating lines in many directions from the car and getting the closest collision point of that line
@@ -565,26 +619,28 @@ class Car:
 
     def getState(self):
         self.setVisionVectors()
-        normalizedVisionVectors = [1 - (max(1.0, line) / self.vectorLength) for line in self.collisionLineDistances]
+        buf = self._state_buf
+        n = len(self.collisionLineDistances)
+        for i, line in enumerate(self.collisionLineDistances):
+            buf[i] = 1 - (max(1.0, line) / self.vectorLength)
 
-        normalizedForwardVelocity = max(0.0, self.vel / self.maxSpeed)
-        normalizedReverseVelocity = max(0.0, self.vel / self.maxReverseSpeed)
+        buf[n] = max(0.0, self.vel / self.maxSpeed)
+        buf[n + 1] = max(0.0, self.vel / self.maxReverseSpeed)
         if self.driftMomentum > 0:
-            normalizedPosDrift = self.driftMomentum / 5
-            normalizedNegDrift = 0
+            buf[n + 2] = self.driftMomentum / 5
+            buf[n + 3] = 0
         else:
-            normalizedPosDrift = 0
-            normalizedNegDrift = self.driftMomentum / -5
+            buf[n + 2] = 0
+            buf[n + 3] = self.driftMomentum / -5
 
         normalizedAngleOfNextGate = (get_angle(self.direction) - get_angle(self.directionToRewardGate)) % 360
         if normalizedAngleOfNextGate > 180:
             normalizedAngleOfNextGate = -1 * (360 - normalizedAngleOfNextGate)
 
-        normalizedAngleOfNextGate /= 180
-
-        normalizedState = [*normalizedVisionVectors, normalizedForwardVelocity, normalizedReverseVelocity,
-                           normalizedPosDrift, normalizedNegDrift, normalizedAngleOfNextGate]
-        return np.array(normalizedState)
+        buf[n + 4] = normalizedAngleOfNextGate / 180
+        # this buffer is reused on the next call; callers that keep the
+        # observation across steps must copy it (Game.get_state() does)
+        return buf
 
     def setVisionVectors(self):
         h = self.height - 4
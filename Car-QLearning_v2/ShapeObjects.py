@@ -6,6 +6,8 @@ import math
 
 
 class Triangle:
+    __slots__ = ('vertices',)
+
     def __init__(self, x1, y1, x2, y2, x3, y3, col=[255, 255, 255]):
         self.vertices = pyglet.graphics.vertex_list(3, ('v3f', [x1, y1, 0, x2, y2, 0, x3, y3, 0]),
                                                     ('c3B', [*col, *col, *col]))
@@ -15,6 +17,8 @@ class Triangle:
 
 
 class Rect:
+    __slots__ = ('x', 'y', 'w', 'h', 'col')
+
     def __init__(self, x, y, w, h):
         self.x = x
         self.y = y
@@ -37,6 +41,10 @@ class Rect:
 
 
 class Line:
+    # every wall and gate on the track owns one of these; slots drop the
+    # per-instance __dict__ and make the coordinate reads a fixed offset
+    __slots__ = ('x1', 'y1', 'x2', 'y2', 'color', 'lineThinkness')
+
     def __init__(self, x1, y1, x2, y2):
         self.x1 = x1
         self.y1 = y1
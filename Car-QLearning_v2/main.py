@@ -8,35 +8,87 @@ from Drawer import Drawer
 from ShapeObjects import Line
 #import tensorflow as tf  # Deep Learning library
 import numpy as np  # Handle matrices
-from collections import deque
 import random
 import os
 from Globals import displayHeight, displayWidth
 from Game import Game
 
 frameRate = 30.0
-os.chdir(r'C:\git\metola_car')
+# physics always advances in steps of this size, however the renderer jitters
+FIXED_DT = 1 / frameRate
+# resources (images/, models/) are addressed relative to this file
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
 vec2 = pygame.math.Vector2
 
+# background color, computed once at import instead of per window
+_BG = (0.0, 0.0, 0.0, 1.0)
+
 """
 a line which the car object cannot touch
 """
 
 
 class Memory:
-    def __init__(self, maxSize):
-        self.buffer = deque(maxlen=maxSize)
-
-    def add(self, experience):
-        self.buffer.append(experience)
+    def __init__(self, maxSize, stateSize=Game.state_size, mmapPath=None):
+        # one preallocated array per transition field (ring buffer),
+        # so sampling is a fancy-index gather on contiguous memory
+        # instead of walking a deque; pass mmapPath to spill the buffer
+        # to disk-backed memmap files (constant RAM however big maxSize
+        # gets, the OS page cache keeps hot entries fast)
+        self.maxSize = maxSize
+        if mmapPath is None:
+            alloc = lambda name, shape, dtype: np.empty(shape, dtype=dtype)
+        else:
+            alloc = lambda name, shape, dtype: np.memmap(
+                "{}.{}".format(mmapPath, name), dtype=dtype, mode='w+', shape=shape)
+        self.state = alloc('state', (maxSize, stateSize), np.float32)
+        self.action = alloc('action', maxSize, np.int32)
+        self.reward = alloc('reward', maxSize, np.float32)
+        self.nextState = alloc('next_state', (maxSize, stateSize), np.float32)
+        self.done = alloc('done', maxSize, np.uint8)
+        self._idx = 0
+        self._size = 0
+        self._rng = np.random.default_rng()
+        # pre-drawn randomness: one big integers() call amortizes the
+        # Generator dispatch over many sample() calls
+        self._pool = self._rng.integers(0, 2**31, size=1 << 16, dtype=np.int64)
+        self._pool_idx = 0
+
+    def add(self, state, action, reward, nextState, done):
+        # fields go straight into the SoA columns; no transition tuple is
+        # ever allocated
+        i = self._idx
+        self.state[i] = state
+        self.action[i] = action
+        self.reward[i] = reward
+        self.nextState[i] = nextState
+        self.done[i] = done
+        self._idx = (i + 1) % self.maxSize
+        if self._size < self.maxSize:
+            self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def flush(self):
+        # persist memmap-backed fields; a no-op for plain arrays
+        for field in (self.state, self.action, self.reward, self.nextState, self.done):
+            if isinstance(field, np.memmap):
+                field.flush()
 
     def sample(self, batchSize):
-        buffer_size = len(self.buffer)
-        index = np.random.choice(np.arange(buffer_size),
-                                 size=batchSize,
-                                 replace=False)
-        return [self.buffer[i] for i in index]
+        # sampling with replacement: constant-time index generation,
+        # negligible statistical cost while the buffer is much bigger
+        # than the batch
+        if self._pool_idx + batchSize > len(self._pool):
+            self._pool = self._rng.integers(0, 2**31, size=len(self._pool),
+                                            dtype=np.int64)
+            self._pool_idx = 0
+        index = self._pool[self._pool_idx:self._pool_idx + batchSize] % self._size
+        self._pool_idx += batchSize
+        return (self.state[index], self.action[index], self.reward[index],
+                self.nextState[index], self.done[index])
 
 """
 
@@ -50,12 +102,12 @@ class MyWindow(pyglet.window.Window):
         self.set_minimum_size(400, 300)
 
         # set background color
-        backgroundColor = [0, 0, 0, 255]
-        backgroundColor = [i / 255 for i in backgroundColor]
-        glClearColor(*backgroundColor)
+        glClearColor(*_BG)
         # load background image
         self.game = Game()
         self.car = self.game.car
+        # accumulator for the fixed-timestep physics loop (see update)
+        self._accum = 0.0
         #self.ai = QLearning(self.game)
 
     """
@@ -167,7 +219,12 @@ class MyWindow(pyglet.window.Window):
         #     else:
         #         self.ai.test()
         #         return
-        self.car.update()
+        # fixed-timestep loop: consume the real elapsed time in FIXED_DT
+        # sized physics sub-steps, decoupling simulation from rendering
+        self._accum += dt
+        while self._accum >= FIXED_DT:
+            self.car.update()
+            self._accum -= FIXED_DT
 
 
 if __name__ == "__main__":
@@ -8,7 +8,6 @@ from Drawer import Drawer
 from ShapeObjects import Line
 #import tensorflow as tf  # Deep Learning library
 import numpy as np  # Handle matrices
-from collections import deque
 import random
 import os
 from Globals import displayHeight, displayWidth
@@ -18,28 +17,81 @@ from PygameAdditionalMethods import *
 import PygameAdditionalMethods as pgam
 
 frameRate = 30.0
-os.chdir(r'C:\git\Car-QLearning_v2')
+# physics always advances in steps of this size, however the renderer jitters
+FIXED_DT = 1 / frameRate
+# resources (images/, models/) are addressed relative to this file
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
 vec2 = pygame.math.Vector2
 
+# background color, computed once at import instead of per window
+_BG = (0.0, 0.0, 0.0, 1.0)
+
 """
 a line which the car object cannot touch
 """
 
 
 class Memory:
-    def __init__(self, maxSize):
-        self.buffer = deque(maxlen=maxSize)
+    def __init__(self, maxSize, stateSize=Game.state_size, mmapPath=None):
+        # one preallocated array per transition field (ring buffer),
+        # so sampling is a fancy-index gather on contiguous memory
+        # instead of walking a deque; pass mmapPath to spill the buffer
+        # to disk-backed memmap files (constant RAM however big maxSize
+        # gets, the OS page cache keeps hot entries fast)
+        self.maxSize = maxSize
+        if mmapPath is None:
+            alloc = lambda name, shape, dtype: np.empty(shape, dtype=dtype)
+        else:
+            alloc = lambda name, shape, dtype: np.memmap(
+                "{}.{}".format(mmapPath, name), dtype=dtype, mode='w+', shape=shape)
+        self.state = alloc('state', (maxSize, stateSize), np.float32)
+        self.action = alloc('action', maxSize, np.int32)
+        self.reward = alloc('reward', maxSize, np.float32)
+        self.nextState = alloc('next_state', (maxSize, stateSize), np.float32)
+        self.done = alloc('done', maxSize, np.uint8)
+        self._idx = 0
+        self._size = 0
+        self._rng = np.random.default_rng()
+        # pre-drawn randomness: one big integers() call amortizes the
+        # Generator dispatch over many sample() calls
+        self._pool = self._rng.integers(0, 2**31, size=1 << 16, dtype=np.int64)
+        self._pool_idx = 0
+
+    def add(self, state, action, reward, nextState, done):
+        # fields go straight into the SoA columns; no transition tuple is
+        # ever allocated
+        i = self._idx
+        self.state[i] = state
+        self.action[i] = action
+        self.reward[i] = reward
+        self.nextState[i] = nextState
+        self.done[i] = done
+        self._idx = (i + 1) % self.maxSize
+        if self._size < self.maxSize:
+            self._size += 1
 
-    def add(self, experience):
-        self.buffer.append(experience)
+    def __len__(self):
+        return self._size
+
+    def flush(self):
+        # persist memmap-backed fields; a no-op for plain arrays
+        for field in (self.state, self.action, self.reward, self.nextState, self.done):
+            if isinstance(field, np.memmap):
+                field.flush()
 
     def sample(self, batchSize):
-        buffer_size = len(self.buffer)
-        index = np.random.choice(np.arange(buffer_size),
-                                 size=batchSize,
-                                 replace=False)
-        return [self.buffer[i] for i in index]
+        # sampling with replacement: constant-time index generation,
+        # negligible statistical cost while the buffer is much bigger
+        # than the batch
+        if self._pool_idx + batchSize > len(self._pool):
+            self._pool = self._rng.integers(0, 2**31, size=len(self._pool),
+                                            dtype=np.int64)
+            self._pool_idx = 0
+        index = self._pool[self._pool_idx:self._pool_idx + batchSize] % self._size
+        self._pool_idx += batchSize
+        return (self.state[index], self.action[index], self.reward[index],
+                self.nextState[index], self.done[index])
 
 """
 
@@ -53,14 +105,48 @@ class MyWindow(pyglet.window.Window):
         self.set_minimum_size(400, 300)
 
         # set background color
-        backgroundColor = [0, 0, 0, 255]
-        backgroundColor = [i / 255 for i in backgroundColor]
-        glClearColor(*backgroundColor)
+        glClearColor(*_BG)
+        # one batch for everything we draw; ordered groups keep the HUD on
+        # top of the track
+        self.batch = pyglet.graphics.Batch()
+        self.backGroup = pyglet.graphics.OrderedGroup(0)
+        self.carGroup = pyglet.graphics.OrderedGroup(1)
+        self.hudGroup = pyglet.graphics.OrderedGroup(2)
         trackImg = pyglet.image.load('images/track.png')
-        self.trackSprite = pyglet.sprite.Sprite(trackImg, x=0, y=0)
+        self.trackSprite = pyglet.sprite.Sprite(trackImg, x=0, y=0,
+                                                batch=self.batch, group=self.backGroup)
+        # HUD text is rendered through IncrementalTextLayouts so a text
+        # change only re-shapes the glyphs that actually differ, and
+        # on_draw skips even that while the score is unchanged
+        hudStyle = dict(font_name='Times New Roman', font_size=24,
+                        color=(255, 255, 255, 255))
+        self.score_doc = pyglet.text.document.UnformattedDocument("Score: 0")
+        self.score_doc.set_style(0, 0, hudStyle)
+        self.score_layout = pyglet.text.layout.IncrementalTextLayout(
+            self.score_doc, width=300, height=40,
+            batch=self.batch, group=self.hudGroup)
+        self.score_layout.x = self.width//20*17
+        self.score_layout.y = self.height//20*19
+        self.score_layout.anchor_y = 'center'
+        self.max_score_doc = pyglet.text.document.UnformattedDocument("Max Score: 0")
+        self.max_score_doc.set_style(0, 0, hudStyle)
+        self.max_score_layout = pyglet.text.layout.IncrementalTextLayout(
+            self.max_score_doc, width=300, height=40,
+            batch=self.batch, group=self.hudGroup)
+        self.max_score_layout.x = self.width//20*17
+        self.max_score_layout.y = self.height//20*18
+        self.max_score_layout.anchor_y = 'center'
+        self._last_score = 0
+        self._last_max_score = 0
         # load background image
         self.game = Game()
         self.car = self.game.car
+        # accumulator for the fixed-timestep physics loop (see update)
+        self._accum = 0.0
+        # the car sprite joins the shared batch too, so a single
+        # batch.draw() call renders the whole frame
+        self.car.carSprite.batch = self.batch
+        self.car.carSprite.group = self.carGroup
         #self.ai = QLearning(self.game)
 
     """
@@ -122,22 +208,15 @@ class MyWindow(pyglet.window.Window):
         
         #self.clear()
 
-        label_score = pyglet.text.Label("Score: " + str(self.car.score),
-                                    font_name='Times New Roman',
-                                    font_size=24,
-                                    x=window.width//20*17, y=window.height//20*19,
-                                    anchor_x='left', anchor_y='center')
-        label_max_score = pyglet.text.Label("Max Score: " + str(self.car.max_score),
-                                    font_name='Times New Roman',
-                                    font_size=24,
-                                    x=window.width//20*17, y=window.height//20*18,
-                                    anchor_x='left', anchor_y='center')                                    
-        
+        if self.car.score != self._last_score:
+            self.score_doc.text = "Score: " + str(self.car.score)
+            self._last_score = self.car.score
+        if self.car.max_score != self._last_max_score:
+            self.max_score_doc.text = "Max Score: " + str(self.car.max_score)
+            self._last_max_score = self.car.max_score
 
-        self.trackSprite.draw()
-        label_score.draw()
-        label_max_score.draw()
         self.car.show()
+        self.batch.draw()
         """    
         for w in self.walls:
             w.draw()
@@ -176,7 +255,12 @@ class MyWindow(pyglet.window.Window):
         #     else:
         #         self.ai.test()
         #         return
-        self.car.update()
+        # fixed-timestep loop: consume the real elapsed time in FIXED_DT
+        # sized physics sub-steps, decoupling simulation from rendering
+        self._accum += dt
+        while self._accum >= FIXED_DT:
+            self.car.update()
+            self._accum -= FIXED_DT
         pass
 
 
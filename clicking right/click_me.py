@@ -1,4 +1,4 @@
-import pyautogui
+import ctypes
 import datetime
 import time
 import numpy as np
@@ -6,6 +6,10 @@ from pynput import keyboard
 
 key_pressed = None
 
+# membership set built once; the listener previously rebuilt the list
+# literal on every keystroke
+KEYS_OF_INTEREST = frozenset(('1', '2', 'left', 'right'))
+
 def on_press(key):
     global key_listened
     if key == keyboard.Key.esc:
@@ -14,7 +18,7 @@ def on_press(key):
         k = key.char  # single-char keys
     except:
         k = key.name  # other keys
-    if k in ['1', '2', 'left', 'right']:  # keys of interest
+    if k in KEYS_OF_INTEREST:  # keys of interest
         # self.keys.append(k)  # store it in global-like variable
         print('Key pressed: ' + k)
         key_pressed = k
@@ -22,21 +26,77 @@ def on_press(key):
 listener = keyboard.Listener(on_press=on_press)
 listener.start()  # start to listen on a separate thread
 
+# Win32 SendInput plumbing: pyautogui spends milliseconds per click on
+# screenshots and fail-safe checks, SendInput fires a whole double click
+# in one syscall
+INPUT_MOUSE = 0
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", ctypes.c_long),
+                ("dy", ctypes.c_long),
+                ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong),
+                ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong))]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong),
+                ("mi", MOUSEINPUT)]
+
+
+user32 = ctypes.windll.user32
+
+# the event arrays are built once; only the cursor position changes per click
+double_click_events = (INPUT * 4)()
+for inp, flag in zip(double_click_events,
+                     (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP,
+                      MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP)):
+    inp.type = INPUT_MOUSE
+    inp.mi.dwFlags = flag
+
+single_click_events = (INPUT * 2)()
+for inp, flag in zip(single_click_events,
+                     (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP)):
+    inp.type = INPUT_MOUSE
+    inp.mi.dwFlags = flag
+
+
+def double_click(x, y):
+    user32.SetCursorPos(x, y)
+    user32.SendInput(4, double_click_events, ctypes.sizeof(INPUT))
+
+
+def left_click(x, y):
+    user32.SetCursorPos(x, y)
+    user32.SendInput(2, single_click_events, ctypes.sizeof(INPUT))
+
+
 amplitude = 27
+# draw all the aim jitter up front: one numpy call instead of two
+# np.random.randint calls per click
+POOL_SIZE = 65536
+jitter_pool = np.random.randint(0, amplitude, size=(POOL_SIZE, 2))
+pool_idx = 0
+
 now = datetime.datetime.now()
 start = time.time()
 i = 0
 while key_pressed is None:
-    killing_zone_x = np.random.randint(1720,1720+amplitude)
-    killing_zone_y = np.random.randint(825,825+amplitude)
-    pyautogui.doubleClick(killing_zone_x,killing_zone_y)
+    killing_zone_x = 1720 + int(jitter_pool[pool_idx, 0])
+    killing_zone_y = 825 + int(jitter_pool[pool_idx, 1])
+    pool_idx = (pool_idx + 1) & (POOL_SIZE - 1)
+    double_click(killing_zone_x, killing_zone_y)
     time.sleep(0.000001)
     if i%50 == 0:
-        pyautogui.leftClick(1772,599)
+        left_click(1772, 599)
         print("New level?")
         print("Clicks per second: ", i*2/time.perf_counter())
     i += 1
-    
+
 
 
 listener.join()  # remove if main thread is polling self.keys
@@ -16,6 +16,9 @@ class Resource(models.Model):
     production = models.IntegerField(default=10)
     negative = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [models.Index(fields=['village', 'name'], name='main_resour_village_4f1f2a_idx')]
+
     def __str__(self) -> str:
         return str(self.name)
 
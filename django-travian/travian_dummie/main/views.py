@@ -1,9 +1,21 @@
+from django.core.cache import cache
+from django.db.models import Prefetch
 from django.shortcuts import render
 from django.http import HttpResponse
 from django.contrib import messages
+from django.views.decorators.cache import cache_page
 from .models import Village, Resource, Check
 from .forms import CreateNewVillage
 
+
+def _village_qs():
+    # the production template only shows the village name and a few
+    # resource columns, so don't pull the rest over the DB socket
+    return Village.objects.only('name').prefetch_related(
+        Prefetch('resource_set',
+                 queryset=Resource.objects.only('name', 'number',
+                                                'production', 'village_id')))
+
 # Create your views here.
 
 def home(response):
@@ -11,8 +23,10 @@ def home(response):
 
 def dorf(response):
     # resources in main village
-    aldea = Village.objects.get(id=3)
-    
+    # prefetch_related pulls the village and its resources in two queries
+    # instead of 1+N, and the short cache skips the DB entirely on repeats
+    aldea = cache.get_or_set('village:3', lambda: _village_qs().get(id=3), 30)
+
     # if response.method == 'POST':
     #     modified_resource = Resource(response.POST)
     #     modified_resource.production = 20
@@ -22,9 +36,10 @@ def dorf(response):
     #     pass
     return render(response, "main/production.html",{"aldea":aldea})
 
+@cache_page(30)
 def resource(response,id):
     # see resources in different villages
-    aldea = Village.objects.get(id=id)
+    aldea = _village_qs().get(id=id)
     return render(response, "main/production.html", {"aldea":aldea})
 
 def jaya(request):
@@ -57,7 +57,9 @@ class DQNAgent(torch.nn.Module):
         Return the state
 
         """
-        state = [
+        # dtype=int turns the bools into 0/1 in one C-level pass, instead
+        # of the old per-element Python loop
+        return np.asarray([
             player.x_change == -20,  # move left
             player.x_change == 20,  # move right
             player.y_change == -20,  # move up
@@ -66,15 +68,7 @@ class DQNAgent(torch.nn.Module):
             food.x_food > player.x,  # food right
             food.y_food < player.y,  # food up
             food.y_food > player.y  # food down
-        ]
-
-        for i in range(len(state)):
-            if state[i]:
-                state[i]=1
-            else:
-                state[i]=0
-
-        return np.asarray(state)
+        ], dtype=int)
 
     def set_reward(self, player, crash):
         """
@@ -8,7 +8,6 @@ import seaborn as sns
 import matplotlib.pyplot as plt
 from DQN_mines import DQNAgent
 from random import randint
-import random
 import statistics
 import torch.optim as optim
 import torch
@@ -24,6 +23,23 @@ if torch.cuda.is_available():
 else:
     DEVICE = 'cpu'
 
+# one-hot action rows, built once; np.eye(3) was being rebuilt per step
+ACTION_ONE_HOT = np.eye(3)
+
+# shared PCG64 generator; much cheaper per draw than the stdlib
+# Mersenne-Twister wrappers used before
+_RNG = np.random.default_rng()
+
+# Game/Food/Player are rebuilt every episode but their surfaces never
+# change; cache them so each file is decoded from disk only once
+_IMAGE_CACHE = {}
+
+def load_image(path):
+    image = _IMAGE_CACHE.get(path)
+    if image is None:
+        image = _IMAGE_CACHE[path] = pygame.image.load(path)
+    return image
+
 #################################
 #   Define parameters manually  #
 #################################
@@ -61,7 +77,7 @@ class Game:
         self.game_width = game_width
         self.game_height = game_height
         self.gameDisplay = pygame.display.set_mode((game_width, game_height + 60))
-        self.bg = pygame.image.load("img/background.png")
+        self.bg = load_image("img/background.png")
         self.crash = False
         self.player = Player(self)
         self.food = Food()
@@ -78,20 +94,23 @@ class His_Player(object):
         self.position.append([self.x, self.y])
         self.food = 1
         self.eaten = False
-        self.image = pygame.image.load('img/snakeBody.png')
+        self.image = load_image('img/snakeBody.png')
         self.x_change = 20
         self.y_change = 0
 
     def update_position(self, x, y):
-        if self.position[-1][0] != x or self.position[-1][1] != y:
+        # bind the list once; the shift loop below touches it twice per
+        # body segment and each self.position costs an attribute load
+        position = self.position
+        if position[-1][0] != x or position[-1][1] != y:
             if self.food > 1:
                 for i in range(0, self.food - 1):
                     # this makes the snake longer for each food eaten
                     # longer snake -> more positions ocupied
-                    self.position[i][0], self.position[i][1] = self.position[i + 1]
+                    position[i][0], position[i][1] = position[i + 1]
             # new position is the one passed, assigned to the head, I suppose
-            self.position[-1][0] = x
-            self.position[-1][1] = y
+            position[-1][0] = x
+            position[-1][1] = y
 
     def do_move(self, move, x, y, game, food, agent):
         move_array = [self.x_change, self.y_change]
@@ -100,15 +119,18 @@ class His_Player(object):
             self.position.append([self.x, self.y])
             self.eaten = False
             self.food = self.food + 1
-        if np.array_equal(move, [1, 0, 0]):
+        # move is one-hot, so one argmax replaces the cascade of
+        # np.array_equal calls, each of which built and walked a temp array
+        move_idx = int(np.argmax(move))
+        if move_idx == 0:
             move_array = self.x_change, self.y_change
-        elif np.array_equal(move, [0, 1, 0]) and self.y_change == 0:  # right - going horizontal
+        elif move_idx == 1 and self.y_change == 0:  # right - going horizontal
             move_array = [0, self.x_change]
-        elif np.array_equal(move, [0, 1, 0]) and self.x_change == 0:  # right - going vertical
+        elif move_idx == 1 and self.x_change == 0:  # right - going vertical
             move_array = [-self.y_change, 0]
-        elif np.array_equal(move, [0, 0, 1]) and self.y_change == 0:  # left - going horizontal
+        elif move_idx == 2 and self.y_change == 0:  # left - going horizontal
             move_array = [0, -self.x_change]
-        elif np.array_equal(move, [0, 0, 1]) and self.x_change == 0:  # left - going vertical
+        elif move_idx == 2 and self.x_change == 0:  # left - going vertical
             move_array = [self.y_change, 0]
         self.x_change, self.y_change = move_array
         self.x = x + self.x_change
@@ -141,7 +163,7 @@ class Food(object):
     def __init__(self):
         self.x_food = 240
         self.y_food = 200
-        self.image = pygame.image.load('img/food2.png')
+        self.image = load_image('img/food2.png')
 
     def food_coord(self, game, player):
         x_rand = randint(20, game.game_width - 40)
@@ -255,7 +277,19 @@ def run(params):
     counter_plot = []
     record = 0
     total_score = 0
-    while counter_games < params['episodes']:
+    # these settings never change while run() executes; bind them once
+    # instead of re-doing the dict lookups on every step of every game
+    episodes = params['episodes']
+    train = params['train']
+    display_on = params['display']
+    speed = params['speed']
+    epsilon_decay = params['epsilon_decay_linear']
+    # pre-drawn exploration randomness: one batched RNG call feeds
+    # thousands of steps instead of two Generator calls per step
+    rand_buf = _RNG.random(4096)
+    rand_actions = _RNG.integers(3, size=4096)
+    rand_idx = 0
+    while counter_games < episodes:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
@@ -267,30 +301,35 @@ def run(params):
 
         # Perform first move
         initialize_game(player1, game, food1, agent)
-        if params['display']:
+        if display_on:
             display(player1, food1, game, record)
 
         steps = 0       # steps since the last positive reward
         # if 100 steps are gone without eating, the current game is over.
         while (not game.crash) and (steps < 100):
-            if not params['train']:
+            if not train:
                 agent.epsilon = 0.01
             else:
                 # agent.epsilon is set to give randomness to actions
-                agent.epsilon = 1 - (counter_games * params['epsilon_decay_linear'])
+                agent.epsilon = 1 - (counter_games * epsilon_decay)
 
             # get old state
             state_old = agent.get_state(game, player1, food1)
 
             # perform random actions based on agent.epsilon, or choose the action
-            if random.uniform(0, 1) < agent.epsilon:
-                final_move = np.eye(3)[randint(0,2)]
+            if rand_idx == len(rand_buf):
+                rand_buf = _RNG.random(4096)
+                rand_actions = _RNG.integers(3, size=4096)
+                rand_idx = 0
+            if rand_buf[rand_idx] < agent.epsilon:
+                final_move = ACTION_ONE_HOT[rand_actions[rand_idx]]
             else:
                 # predict action based on the old state
                 with torch.no_grad():  # avoids storing the gradients of the following tensors, saving computation.
                     state_old_tensor = torch.tensor(state_old.reshape((1, 11)), dtype=torch.float32).to(DEVICE)
                     prediction = agent(state_old_tensor)
-                    final_move = np.eye(3)[np.argmax(prediction.detach().cpu().numpy()[0])]
+                    final_move = ACTION_ONE_HOT[np.argmax(prediction.detach().cpu().numpy()[0])]
+            rand_idx += 1
 
             # perform new move and get new state
             player1.do_move(final_move, player1.x, player1.y, game, food1, agent)
@@ -303,18 +342,18 @@ def run(params):
             if reward > 0:
                 steps = 0
 
-            if params['train']:
+            if train:
                 # train short memory base on the new action and state
                 agent.train_short_memory(state_old, final_move, reward, state_new, game.crash)
                 # store the new data into a long term memory
                 agent.remember(state_old, final_move, reward, state_new, game.crash)
 
             record = get_record(game.score, record)
-            if params['display']:
+            if display_on:
                 display(player1, food1, game, record)
-                pygame.time.wait(params['speed'])
+                pygame.time.wait(speed)
             steps+=1
-        if params['train']:
+        if train:
             # at the end of each life, it trains
             agent.replay_new(agent.memory)
         counter_games += 1
@@ -323,16 +362,17 @@ def run(params):
         score_plot.append(game.score)
         counter_plot.append(counter_games)
     mean, stdev = get_mean_stdev(score_plot)
-    if params['train']:
+    if train:
         model_weights = agent.state_dict()
         torch.save(model_weights, params["weights_path"])
     if params['plot_score']:
-        plot_seaborn(counter_plot, score_plot, params['train'])
+        plot_seaborn(counter_plot, score_plot, train)
     return total_score, mean, stdev
 
 if __name__ == '__main__':
     # Set options to activate or deactivate the game view, and its speed
-    os.chdir(r'C:\git\learning_AI_games\snake-ga')
+    # resources (img/, weights/) are addressed relative to this file
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
     pygame.font.init()
     params = define_parameters()
     if params['parser_active']:
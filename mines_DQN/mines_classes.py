@@ -14,16 +14,20 @@ class Player():
     resource_list = ["wood","clay","iron","wheat"]
     num_resources = len(resource_list)
     storage = 2000
-    resources = np.ones((1,num_resources))
     BUILDING_AMOUNT = 0
     imp_costs =   np.array([[1, 100, 100, 100],
                             [100, 1, 100, 100],
                             [100, 100, 1, 100],
                             [100, 100, 100, 1]])
     imp_growths = np.array([100, 200, 400, 600])
+    MAX_LEVEL = 20
+    # upgrade costs precomputed once per class: buying level L+1 of
+    # building b costs COST_TABLE[b, L-1]
+    COST_TABLE = (imp_costs[:, None, :] * np.arange(1, MAX_LEVEL + 1)[None, :, None]).astype(np.int32)
 
     def __init__(self, starting_resources=800, starting_production = 10) -> None:
-        self.production = [starting_production]*len(self.resource_list)
+        # flat float32 arrays so storage updates are single vectorized ops
+        self.production = np.full(self.num_resources, starting_production, dtype=np.float32)
         self.starting_resources = starting_resources
 
         self.reset_dorf()
@@ -42,24 +46,25 @@ class Player():
                                         iron_mine.level,
                                         crop.level])
 
-        self.resources = (self.resources * 0) + self.starting_resources
+        self.resources = np.full(self.num_resources, self.starting_resources, dtype=np.float32)
 
     def reduce_storage(self, costs) -> None:
         """Update materials after purchase"""
-        self.resources -= costs
+        np.subtract(self.resources, costs, out=self.resources, casting='unsafe')
 
     def harvest(self):
         """Increase materials after turn end"""
-        self.resources += self.production
+        np.add(self.resources, self.production, out=self.resources)
 
     def check_positive_storage(self):
         """Test storage is positive"""
-        return (self.resources > -1).all()
+        return bool((self.resources >= 0).all())
 
     def print_storage(self):
         """Print current materials"""
-        for name,value in zip(self.resource_list, self.resources):
-            print(name, ": ", value)
+        # one joined write instead of a print (and IO flush) per resource
+        print("\n".join(f"{name} :  {value}"
+                        for name, value in zip(self.resource_list, self.resources)))
 
     def print_buildings(self):
         """Buildings built in village"""
@@ -70,28 +75,28 @@ class Player():
 
     def print_building_details(self):
         """Buildings built in village"""
-        print("\nBuildings in Dorf: ")
-        for building in self.buildings:
-            building.print_detail_info()
+        details = "\n".join(building.detail_info() for building in self.buildings)
+        print("\nBuildings in Dorf: \n" + details)
 
     def check_purchasing_power(self, improvement_id):
         """Checks if the town has enough resources to buy the improvement"""
-        improvement = self.buildings[improvement_id -1]  # indexation starts in 0
-        resources = self.resources
-        costs = improvement.cost
+        level = self.building_levels[improvement_id]  # indexation starts in 0
+        if level > self.MAX_LEVEL:
+            # the cost table only covers levels 1..MAX_LEVEL; past the
+            # cap nothing more can be bought
+            return False
         # TODO: divide requirement per resource type
-        if (resources > costs).all():
-            able = True
-        else:
-            able = False
-        return able
+        return bool((self.resources >= self.COST_TABLE[improvement_id, level - 1]).all())
 
     def purchase_improvement(self, improvement_id) -> None:
         """Main function to buy an improvement"""
         if not self.check_purchasing_power(improvement_id):
             return
-        improved_building = self.buildings[improvement_id -1]  # indexation starts in 0
-        self.reduce_storage(improved_building.cost)
+        level = self.building_levels[improvement_id]  # indexation starts in 0
+        self.reduce_storage(self.COST_TABLE[improvement_id, level - 1])
+        self.building_levels[improvement_id] = level + 1
+        # keep the Improvement objects in sync for the print_* helpers
+        improved_building = self.buildings[improvement_id]
         improved_building.upgrade()
         print(f"{improved_building.name} upgraded to level {improved_building.level}!")
 
@@ -118,21 +123,21 @@ class Improvement():
         """Print building info"""
         print(f"{self.name} (level {self.level})")
 
+    def detail_info(self):
+        """Build the building info block as a string"""
+        next_level_prod = self.production/self.level*(self.level+1)
+        return ("Building info:\n"
+                f"{self.name} (level {self.level}) - Production: {self.production}\n"
+                f"Next level -- Cost: {self.cost} -- Production: {next_level_prod}\n")
+
     def print_detail_info(self):
         """Print building info"""
-        print("Building info:")
-        print(f"{self.name} (level {self.level}) - Production: {self.production}")
-        next_level_prod = self.production/self.level*(self.level+1)
-        print(f"Next level -- Cost: {self.cost} -- Production: {next_level_prod}\n")
+        print(self.detail_info())
 
 
 
 
 if __name__ == '__main__':
-    d = Dorf()
-
-    d.print_buildings()
-
-    d.print_buildings()
+    d = Player()
 
     d.print_buildings()
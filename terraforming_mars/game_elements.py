@@ -1,7 +1,10 @@
 """
     A general list of elements in the game. I will organize and subdivide later.
 """
+import numpy as np
+
 RESOURCES = ['megacredits', 'steel', 'titanium', 'plants', 'energy', 'heat']
+RES_IDX = {name: i for i, name in enumerate(RESOURCES)}
 STANDARD_PJ = ['sell patent', 'power plant', 'asteroid', 'aquifier', 'greenery',' city']
 
 class game_elem():
@@ -42,14 +45,29 @@ class Player():
         self.corporation = 'basic'
         self.vict_points = 0
         self.terr_points = 20
-        self.resources = dict.fromkeys(RESOURCES, 0)
-        self.res_production = dict.fromkeys(RESOURCES, 0)
-        
+        # one slot per entry of RESOURCES (see RES_IDX for the mapping);
+        # keeping them as arrays makes the per-turn production a single add
+        self.resources = np.zeros(len(RESOURCES), dtype=np.int32)
+        self.res_production = np.zeros(len(RESOURCES), dtype=np.int32)
+
         # turn
         self.turn_active = False
         self.actions_left = 2
         self.log = []
-    pass
+
+    def get_resource(self, name):
+        return int(self.resources[RES_IDX[name]])
+
+    def add_resource(self, name, qty):
+        self.resources[RES_IDX[name]] += qty
+
+    def produce(self):
+        """Apply one turn of production in a single vectorized add"""
+        self.resources += self.res_production
+
+    def update_resources(self, delta):
+        """Apply a per-resource delta array (same layout as RESOURCES)"""
+        self.resources += delta
 
 
 class Milestones_and_Awards():
@@ -24,7 +24,7 @@ class Turn():
 
     def start_turn(self):
         """Checks possible actions for player"""
-        logging.info("Start of turn %s", str(self.turn_number))
+        logging.info("Start of turn %s", self.turn_number)
         self.options, _ = self.possible_actions()
 
     def player_action(self, turn_selection):
@@ -95,8 +95,9 @@ class Game():
         for turn_number in range(self.turns):
             current_turn = Turn(turn_number, self.points)
             current_turn.start_turn()
-            options, _ = current_turn.possible_actions()
-            selected = self.player.call(options)
+            # start_turn already computed the options; don't walk the
+            # buildings a second time
+            selected = self.player.call(current_turn.options)
             current_turn.player_action(selected)
             current_turn.end_turn()
 
@@ -120,15 +121,21 @@ class Player():
     Creates players who only have random choice selection
     """
     def __init__(self, name="dummie") -> None:
-        pass
+        # each player owns its generator, so nothing contends on the
+        # global numpy RNG state
+        self._rng = np.random.default_rng()
 
     def call(self, options):
         """Selects an option among the ones offered."""
-        if len(options) is 0:
+        if len(options) == 0:
             choice = 'pass'
+        elif len(options) == 1:
+            # forced move: nothing to draw from
+            choice = options[0]
+            logging.info("I want to build option %s", choice)
         else:
-            choice = np.random.choice(options)
-            logging.info("I want to build option %s", str(choice))
+            choice = self._rng.choice(options)
+            logging.info("I want to build option %s", choice)
         return choice
 
 if __name__ == '__main__':
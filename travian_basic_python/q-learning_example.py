@@ -7,7 +7,6 @@ import matplotlib.style
 import numpy as np
 import pandas as pd
 
-from collections import defaultdict
 from windy_gridworld import WindyGridworldEnv
 import plotting
 
@@ -21,18 +20,17 @@ def createEpsilonGreedyPolicy(Qfunc, epsilon, num_actions):
     on a given Q-function and epsilon.
 
     Returns a function that takes the state
-    as an input and returns the probabilities
-    for each action in the form of a numpy array
-    of length of the action space(set of possible actions).
+    as an input and samples an action from the
+    epsilon-greedy distribution directly: explore
+    uniformly with probability epsilon, otherwise
+    exploit the argmax. Same distribution as the old
+    probability-vector version, without allocating
+    and sampling an array per step.
     """
     def policyFunction(state):
-
-        action_probabilities = np.ones(num_actions,
-                dtype = float) * epsilon / num_actions
-
-        best_action = np.argmax(Qfunc[state])
-        action_probabilities[best_action] += (1.0 - epsilon)
-        return action_probabilities
+        if np.random.random() < epsilon:
+            return np.random.randint(num_actions)
+        return int(np.argmax(Qfunc[state]))
 
     return policyFunction
 
@@ -44,9 +42,10 @@ def qLearning(env, num_episodes, discount_factor = 1.0,
     following an epsilon-greedy policy"""
 
     # Action value function
-    # A nested dictionary that maps
-    # state -> (action -> action-value).
-    Qfunc = defaultdict(lambda: np.zeros(env.action_space.n))
+    # A dense (num_states, num_actions) array; the gridworld states are
+    # already small integers, so rows index directly with no dict
+    # hashing or per-state array allocation.
+    Qfunc = np.zeros((env.nS, env.action_space.n))
 
     # Keeps track of useful statistics
     stats = plotting.EpisodeStats(
@@ -65,14 +64,8 @@ def qLearning(env, num_episodes, discount_factor = 1.0,
 
         for t in itertools.count():
 
-            # get probabilities of all actions from current state
-            action_probabilities = policy(state)
-
-            # choose action according to
-            # the probability distribution
-            action = np.random.choice(np.arange(
-                    len(action_probabilities)),
-                    p = action_probabilities)
+            # sample the epsilon-greedy action for the current state
+            action = policy(state)
 
             # take action and get reward, transit to next state
             next_state, reward, done, _ = env.step(action)
@@ -57,8 +57,9 @@ class Dorf():
 
     def print_storage(self):
         """Print current materials"""
-        for name,value in zip(self.resource_list, self.resources):
-            print(name, ": ", value)
+        # one joined write instead of a print (and IO flush) per resource
+        print("\n".join(f"{name} :  {value}"
+                        for name, value in zip(self.resource_list, self.resources)))
 
     def print_buildings(self):
         """Buildings built in village"""
@@ -69,9 +70,8 @@ class Dorf():
 
     def print_building_details(self):
         """Buildings built in village"""
-        print("\nBuildings in Dorf: ")
-        for building in self.buildings:
-            building.print_detail_info()
+        details = "\n".join(building.detail_info() for building in self.buildings)
+        print("\nBuildings in Dorf: \n" + details)
 
     def check_purchasing_power(self, improvement_id):
         """Checks if the town has enough resources to buy the improvement"""
@@ -117,12 +117,16 @@ class Improvement():
         """Print building info"""
         print(f"{self.name} (level {self.level})")
 
+    def detail_info(self):
+        """Build the building info block as a string"""
+        next_level_prod = self.production/self.level*(self.level+1)
+        return ("Building info:\n"
+                f"{self.name} (level {self.level}) - Production: {self.production}\n"
+                f"Next level -- Cost: {self.cost} -- Production: {next_level_prod}\n")
+
     def print_detail_info(self):
         """Print building info"""
-        print("Building info:")
-        print(f"{self.name} (level {self.level}) - Production: {self.production}")
-        next_level_prod = self.production/self.level*(self.level+1)
-        print(f"Next level -- Cost: {self.cost} -- Production: {next_level_prod}\n")
+        print(self.detail_info())
 
 
 
@@ -174,8 +174,10 @@ class Village(Env, Dorf):
         """
         self.turns_left = self.game_turns - self.turn_number
         build_option = self.buildings[action-1]
-        next_level_prod = build_option.production/build_option.level*(build_option.level+1)
-        prod_increase = next_level_prod - build_option.production
+        # production grows linearly (growth per level), so the gain from
+        # one upgrade is just the growth vector; no need to divide the
+        # current production back out
+        prod_increase = build_option.growth
         reward = np.sum(prod_increase * self.turns_left).astype(float)
         # TODO some resources should have more value than others for reward. Do a weighted sum!
         return reward